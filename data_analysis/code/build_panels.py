@@ -13,8 +13,16 @@ then constructs:
 Output: trader_day_{DATE}.csv and market_day_{DATE}.csv in ``OUT_DIR``.
 """
 
+import hashlib
+import inspect
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
 
 # ============================================================
 # Parameters
@@ -24,30 +32,178 @@ SESSIONS = ["uik7aoor"]
 
 RAW_DIR = "../raw_data"
 OUT_DIR = "../processed_data"
+CACHE_DIR = f"{OUT_DIR}/.cache"  # parsed raw exports, keyed by content hash
 
 ROUNDS_PER_REPETITION = 15  # trading days per repetition
 DIVIDEND_PER_PERIOD = 8  # constant per-period dividend
 BUBBLE_SURGE_SIGMA = 2  # σ threshold for surge/crash/bubble flags
 TRADER_TYPE_THRESHOLD = 5  # min flag count to classify trader type
 
+CSV_CHUNK_ROWS = 100_000  # rows per chunk when streaming oTree exports
+CSV_BLOCK_BYTES = 64 << 20  # bytes per block when streaming the MBO export
+
 # ============================================================
 # 1. Load raw oTree exports
 # ============================================================
 
 
-def load_raw(date: str, sessions: list[str]) -> tuple:
-    """Read CSVs and keep only rows from target sessions."""
-    intro = pd.read_csv(f"{RAW_DIR}/intro_{date}.csv")
-    intro = intro[intro["session.code"].isin(sessions)]
+# only the columns consumed below are parsed (projection pushdown)
+INTRO_COLS = [
+    "session.code",
+    "participant.code",
+    "player.self_assesment",
+    "player.cq_attempt_count",
+]
+POST_EXP_COLS = [
+    "session.code",
+    "participant.code",
+    "participant.payoff",
+    "player.payoff_for_trade",
+    "player.gender",
+    "player.age",
+    "player.course_financial",
+    "player.trading_experience",
+    "player.education",
+    "player.num_correct_answers",
+    "player.num_quiz_questions",
+    "player.email",
+    "player.ucid",
+]
+APP_COLS = [
+    "session.code",
+    "participant.code",
+    "participant.payoff",
+    "participant._current_page_name",
+    "player.trader_uuid",
+    "player.assigned_initial_cash",
+    "player.forecast_price_next_day",
+    "player.forecast_confidence_next_day",
+    "player.algo_belief_present",
+    "player.algo_belief_confidence",
+    "player.num_shares",
+    "player.current_cash",
+    "subsession.round_number",
+    "group.noise_trader_present",
+    "group.market_design",
+    "group.group_composition",
+    "group.trading_session_uuid",
+]
+
+# MBO columns with explicit Arrow types, so every streamed block parses alike;
+# UUIDs arrive dictionary-encoded (pandas ``category``)
+UUID_TYPE = pa.dictionary(pa.int32(), pa.string())
+MBO_TYPES = {
+    "trading_session_uuid": UUID_TYPE,
+    "market_number": pa.int64(),
+    "trading_day": pa.int64(),
+    "event_seq": pa.int64(),
+    "event_ts": pa.timestamp("us", tz="UTC"),
+    "record_kind": pa.string(),
+    "aggressor_side": pa.string(),
+    "price": pa.float64(),
+    "bid_trader_uuid": UUID_TYPE,
+    "ask_trader_uuid": UUID_TYPE,
+}
 
-    post_exp = pd.read_csv(f"{RAW_DIR}/post_exp_{date}.csv")
-    post_exp = post_exp[post_exp["session.code"].isin(sessions)]
 
-    app = pd.read_csv(f"{RAW_DIR}/trader_bridge_app_{date}.csv")
-    app = app[app["session.code"].isin(sessions)]
-    app = app[app["participant._current_page_name"] == "FinalForProlific"]
+def read_sessions(path: str, usecols: list[str], sessions: list[str]) -> pd.DataFrame:
+    """Stream an oTree export in chunks, keeping only rows from ``sessions``."""
+    chunks = pd.read_csv(path, usecols=usecols, chunksize=CSV_CHUNK_ROWS)
+    return pd.concat(chunk[chunk["session.code"].isin(sessions)] for chunk in chunks)
+
+
+def read_mbo_trades(path: str, types: dict) -> pd.DataFrame:
+    """Stream the MBO export block by block, retaining only trade records."""
+    reader = pv.open_csv(
+        path,
+        read_options=pv.ReadOptions(block_size=CSV_BLOCK_BYTES),
+        convert_options=pv.ConvertOptions(
+            include_columns=list(types),
+            column_types=types,
+            strings_can_be_null=True,
+        ),
+    )
+    batches = [
+        batch.filter(pc.equal(batch["record_kind"], "trade")) for batch in reader
+    ]
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+
+    # QA on the Arrow buffers, before any pandas conversion. Incomplete trades
+    # are kept: a missing trader skips that side's buy/sell count, a missing
+    # price is ignored by the price stats, and a missing time gives NaN diff_time
+    incomplete = pc.is_null(table["event_ts"])
+    for col in ("price", "bid_trader_uuid", "ask_trader_uuid"):
+        incomplete = pc.or_(incomplete, pc.is_null(table[col]))
+    n_incomplete = pc.sum(incomplete).as_py() or 0
+    if n_incomplete:
+        print(
+            f"Warning: {n_incomplete:,} MBO trades missing time, price or trader; "
+            "kept, but left out of the statistics that need the missing field."
+        )
+
+    # sorted once here (and cached sorted) so markets are contiguous downstream
+    return table.to_pandas().sort_values(
+        ["trading_session_uuid", "event_seq"], kind="stable", ignore_index=True
+    )
 
-    mbo = pd.read_csv(f"{RAW_DIR}/trader_bridge_app_custom_export_mbo_{date}.csv")
+
+def cached_read(read, path: str, *args) -> pd.DataFrame:
+    """Return ``read(path, *args)``, reusing a Parquet copy while inputs are unchanged.
+
+    The cache key hashes the raw file's bytes together with the reader's source
+    and its arguments (columns, sessions, types), so editing any of them
+    re-parses. Only use it for exports without personal data.
+    """
+    with open(path, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256")
+    digest.update(repr((inspect.getsource(read), args)).encode())
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cache_path = f"{CACHE_DIR}/{stem}.{digest.hexdigest()[:12]}.parquet"
+    if os.path.exists(cache_path):
+        return pd.read_parquet(cache_path)
+
+    df = read(path, *args)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # write aside and rename, so an interrupted run never leaves a partial file
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    df.to_parquet(tmp_path)
+    os.replace(tmp_path, cache_path)
+    return df
+
+
+def load_raw(date: str, sessions: list[str]) -> tuple:
+    """Read CSVs and keep only rows from target sessions (trades for MBO)."""
+    # the four exports are independent; parse (or load from cache) concurrently.
+    # post_exp holds emails and student IDs, so it is never cached to disk
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        intro = pool.submit(
+            cached_read,
+            read_sessions,
+            f"{RAW_DIR}/intro_{date}.csv",
+            INTRO_COLS,
+            sessions,
+        )
+        post_exp = pool.submit(
+            read_sessions,
+            f"{RAW_DIR}/post_exp_{date}.csv",
+            POST_EXP_COLS,
+            sessions,
+        )
+        app = pool.submit(
+            cached_read,
+            read_sessions,
+            f"{RAW_DIR}/trader_bridge_app_{date}.csv",
+            APP_COLS,
+            sessions,
+        )
+        mbo = pool.submit(
+            cached_read,
+            read_mbo_trades,
+            f"{RAW_DIR}/trader_bridge_app_custom_export_mbo_{date}.csv",
+            MBO_TYPES,
+        )
+    intro, post_exp, app, mbo = (f.result() for f in (intro, post_exp, app, mbo))
+    app = app[app["participant._current_page_name"] == "FinalForProlific"]
 
     return intro, post_exp, app, mbo
 
@@ -105,6 +261,9 @@ TRADER_DAY_COLS = [
 ]
 
 trader_day = app.rename(columns=APP_COLUMN_MAP)[TRADER_DAY_COLS].copy()
+# identifiers as categoricals so groupby / dedup work on integer codes
+for col in ("participant_code", "market_uuid", "trader_uuid"):
+    trader_day[col] = trader_day[col].astype("category")
 
 # --- 2b. Post-experiment survey & demographics ---------------------
 
@@ -182,7 +341,7 @@ trader_day["algorithm_belief"] = np.where(
     np.nan,
 )
 trader_day["algorithm_belief"] = trader_day.groupby(
-    ["market_uuid", "participant_code"]
+    ["market_uuid", "participant_code"], observed=True, sort=False
 )["algorithm_belief"].transform("max")
 
 # ============================================================
@@ -191,7 +350,7 @@ trader_day["algorithm_belief"] = trader_day.groupby(
 
 # --- 3a. Trade-level panel -----------------------------------------
 
-trades = mbo[mbo["record_kind"] == "trade"].copy()
+trades = mbo.copy()
 trades = trades.rename(
     columns={
         "bid_trader_uuid": "buyer_uuid",
@@ -200,11 +359,50 @@ trades = trades.rename(
         "market_number": "repetition",
     }
 )
+# buyers and sellers share one dictionary so their codes are comparable
+trader_ids = trades["buyer_uuid"].cat.categories.union(
+    trades["seller_uuid"].cat.categories
+)
+trades["buyer_uuid"] = trades["buyer_uuid"].cat.set_categories(trader_ids)
+trades["seller_uuid"] = trades["seller_uuid"].cat.set_categories(trader_ids)
+
+# QA: a self-trade inflates both n_buys and n_sells for the same trader
+buyer_codes = trades["buyer_uuid"].cat.codes.to_numpy()
+seller_codes = trades["seller_uuid"].cat.codes.to_numpy()
+n_self_trades = int(
+    np.count_nonzero((buyer_codes == seller_codes) & (buyer_codes >= 0))
+)
+if n_self_trades:
+    print(f"Warning: {n_self_trades:,} self-trades in the MBO export.")
+
 trades["fundamental_value"] = fundamental_value(trades["trading_day"])
-trades["event_ts"] = pd.to_datetime(trades["event_ts"])
-trades["diff_time"] = (
-    trades.groupby("market_uuid")["event_ts"].diff().dt.total_seconds().shift(-1)
+
+
+def diff_within(values: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Difference to the previous row of the same group (NaN on first rows).
+
+    Rows of each group must be contiguous, as in the pre-sorted MBO trades.
+    """
+    same = codes[1:] == codes[:-1]
+    # each group may start only one run; -1 (no group) rows always get NaN
+    run_codes = np.r_[codes[:1], codes[1:][~same]]
+    if np.any(np.bincount(run_codes[run_codes >= 0]) > 1):
+        raise ValueError("rows of each group must be contiguous")
+    same &= codes[1:] >= 0
+    d = np.full(len(values), np.nan)
+    d[1:] = np.where(same, np.diff(values), np.nan)
+    return d
+
+
+# seconds until the next trade in the same market; kept in float so a missing
+# timestamp gives NaN gaps rather than NaT's int64 sentinel
+event_us = np.where(
+    trades["event_ts"].isna(),
+    np.nan,
+    trades["event_ts"].dt.as_unit("us").astype(np.int64).to_numpy(),
 )
+gap = diff_within(event_us, trades["market_uuid"].cat.codes.to_numpy()) / 1e6
+trades["diff_time"] = np.append(gap[1:], np.nan)
 trades["mispricing"] = trades["price"] - trades["fundamental_value"]
 trades["abs_mispricing"] = trades["mispricing"].abs()
 
@@ -227,7 +425,9 @@ trades = trades[TRADE_COLS].reset_index(drop=True)
 # --- 3b. Market-period aggregates -----------------------------------
 
 mp = (
-    trades.groupby(["market_uuid", "repetition", "trading_day"])
+    trades.groupby(
+        ["market_uuid", "repetition", "trading_day"], observed=True, sort=False
+    )
     .agg(
         n_trades_market=("price", "count"),
         avg_trade_price=("price", "mean"),
@@ -242,20 +442,52 @@ mp = (
     .reset_index()
 )
 
+
+def unique_rows(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+    """Distinct combinations of ``cols`` in first-seen order, keyed on group codes."""
+    keys = df.groupby(cols, observed=True, sort=False, dropna=False).size().index
+    return keys.to_frame(index=False)
+
+
+def ffill_within(values: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs without crossing boundaries of contiguous groups."""
+    last_valid = np.where(np.isnan(values), -1, np.arange(len(values)))
+    last_valid = np.maximum.accumulate(last_valid)
+    src = np.maximum(last_valid, 0)
+    keep = (last_valid >= 0) & (codes[src] == codes)
+    return np.where(keep, values[src], np.nan)
+
+
+def shift_within(values: np.ndarray, codes: np.ndarray, periods: int) -> np.ndarray:
+    """Shift by ``periods`` rows without crossing boundaries of contiguous groups."""
+    out = np.full(len(values), np.nan)
+    if periods > 0:
+        same = codes[periods:] == codes[:-periods]
+        out[periods:] = np.where(same, values[:-periods], np.nan)
+    else:
+        same = codes[:periods] == codes[-periods:]
+        out[:periods] = np.where(same, values[-periods:], np.nan)
+    return out
+
+
 # fill in zero-trade periods from trader_day skeleton
 mp = mp.merge(
-    trader_day[["market_uuid", "repetition", "trading_day"]].drop_duplicates(),
+    unique_rows(trader_day, ["market_uuid", "repetition", "trading_day"]),
     how="outer",
 )
+mp = mp.sort_values(["market_uuid", "repetition", "trading_day"], ignore_index=True)
 mp["n_trades_market"] = mp["n_trades_market"].fillna(0)
 mp["fundamental_value"] = fundamental_value(mp["trading_day"])
-mp["closing_price"] = mp.groupby("market_uuid")["closing_price"].ffill()
 
-# price lags and returns
-mp["price_L1"] = mp.groupby("market_uuid")["closing_price"].shift(1)
-mp["price_L2"] = mp.groupby("market_uuid")["closing_price"].shift(2)
-mp["price_next"] = mp.groupby("market_uuid")["closing_price"].shift(-1)
-mp["return"] = mp.groupby("market_uuid")["closing_price"].pct_change()
+# price fill, lags, and returns in one sweep over market-contiguous rows
+market_codes = pd.factorize(mp["market_uuid"])[0]
+closing = ffill_within(mp["closing_price"].to_numpy(dtype=float), market_codes)
+mp["closing_price"] = closing
+prev_closing = shift_within(closing, market_codes, 1)
+mp["price_L1"] = prev_closing
+mp["price_L2"] = shift_within(closing, market_codes, 2)
+mp["price_next"] = shift_within(closing, market_codes, -1)
+mp["return"] = closing / prev_closing - 1  # price ratio, no pct_change pass
 mp["abs_mispricing_ratio"] = mp["avg_abs_mispricing"] / mp["fundamental_value"]
 
 # --- 3c. Surge, crash, and bubble flags (Asparouhova 2024; Noussair 2001)
@@ -263,10 +495,27 @@ mp["abs_mispricing_ratio"] = mp["avg_abs_mispricing"] / mp["fundamental_value"]
 
 def flag_extremes(series: pd.Series, group_key: str, sigma: float = BUBBLE_SURGE_SIGMA):
     """Return +1 / −1 flags for observations beyond ±σ from group mean."""
-    mu = series.groupby(group_key).transform("mean")
-    sd = series.groupby(group_key).transform("std")
-    high = (series > mu + sigma * sd).astype(int)
-    low = (series < mu - sigma * sd).astype(int)
+    codes, groups = pd.factorize(group_key)
+    x = series.to_numpy(dtype=float)
+    valid = ~np.isnan(x) & (codes >= 0)  # NaN keys form no group, as in groupby
+    c, xv = codes[valid], x[valid]
+
+    # group mean, then sample sd from centred deviations (two linear passes)
+    n = np.bincount(c, minlength=len(groups))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        group_mean = np.bincount(c, weights=xv, minlength=len(groups)) / n
+        dev = xv - group_mean[c]
+        group_ss = np.bincount(c, weights=dev * dev, minlength=len(groups))
+        group_sd = np.sqrt(group_ss / (n - 1))
+
+    keyed = codes >= 0
+    mu = np.full(len(x), np.nan)
+    sd = np.full(len(x), np.nan)
+    mu[keyed] = group_mean[codes[keyed]]
+    sd[keyed] = group_sd[codes[keyed]]
+
+    high = pd.Series((x > mu + sigma * sd).astype(int), index=series.index)
+    low = pd.Series((x < mu - sigma * sd).astype(int), index=series.index)
     return high, low
 
 
@@ -279,7 +528,11 @@ mp["bubble_period"], _ = flag_extremes(mp["normalized_mispricing"], mp["repetiti
 mp["bubble_start"] = (
     (mp["bubble_period"] == 1)
     & (
-        mp.groupby(["market_uuid", "repetition"])["bubble_period"].shift(1).fillna(0)
+        mp.groupby(["market_uuid", "repetition"], observed=True, sort=False)[
+            "bubble_period"
+        ]
+        .shift(1)
+        .fillna(0)
         == 0
     )
 ).astype(int)
@@ -292,21 +545,38 @@ mp["bubble_start"] = (
 
 def count_trades_by_side(trades: pd.DataFrame) -> pd.DataFrame:
     """Count buys and sells per trader × market × day."""
-    buys = (
-        trades.groupby(["market_uuid", "trading_day", "buyer_uuid"])
-        .size()
-        .reset_index(name="n_buys")
-        .rename(columns={"buyer_uuid": "trader_uuid"})
+    markets = trades["market_uuid"].cat.categories
+    traders = trades["buyer_uuid"].cat.categories  # shared with seller_uuid
+    # rows without a market or day have no key, as under groupby's dropna
+    market = trades["market_uuid"].cat.codes.to_numpy(np.int64)
+    day = trades["trading_day"].to_numpy(dtype=float)
+    keep = (market >= 0) & ~np.isnan(day)
+    market, day = market[keep], day[keep].astype(np.int64)
+    n_days = int(day.max()) + 1 if len(day) else 1
+    n_traders = len(traders)
+
+    # one composite int64 key per (market, day, trader), counted per side
+    base = (market * n_days + day) * n_traders
+    n_keys = len(markets) * n_days * n_traders
+    buyer = trades["buyer_uuid"].cat.codes.to_numpy(np.int64)[keep]
+    seller = trades["seller_uuid"].cat.codes.to_numpy(np.int64)[keep]
+    # a missing trader has code -1; drop that side, as groupby drops NaN keys
+    buys = np.bincount((base + buyer)[buyer >= 0], minlength=n_keys)
+    sells = np.bincount((base + seller)[seller >= 0], minlength=n_keys)
+    uniq = np.flatnonzero(buys + sells)
+    n_buys, n_sells = buys[uniq], sells[uniq]
+
+    market_day, trader_code = np.divmod(uniq, n_traders)
+    market_code, day_code = np.divmod(market_day, n_days)
+    out = pd.DataFrame(
+        {
+            "market_uuid": pd.Categorical.from_codes(market_code, markets),
+            "trading_day": day_code,
+            "trader_uuid": pd.Categorical.from_codes(trader_code, traders),
+            "n_buys": n_buys,
+            "n_sells": n_sells,
+        }
     )
-    sells = (
-        trades.groupby(["market_uuid", "trading_day", "seller_uuid"])
-        .size()
-        .reset_index(name="n_sells")
-        .rename(columns={"seller_uuid": "trader_uuid"})
-    )
-    out = buys.merge(
-        sells, how="outer", on=["market_uuid", "trader_uuid", "trading_day"]
-    ).fillna(0)
     out["net_position"] = out["n_buys"] - out["n_sells"]
     return out
 
@@ -336,7 +606,8 @@ trader_day["wealth_day"] = (
 
 def gini(x: pd.Series) -> float:
     """Gini coefficient for a wealth vector."""
-    vals = pd.Series(x).dropna().astype(float).values
+    vals = x.to_numpy(dtype=float)
+    vals = vals[~np.isnan(vals)]
     if len(vals) == 0:
         return np.nan
     mu = vals.mean()
@@ -345,9 +616,9 @@ def gini(x: pd.Series) -> float:
     return np.abs(vals[:, None] - vals[None, :]).sum() / (2 * len(vals) ** 2 * mu)
 
 
-trader_day["gini"] = trader_day.groupby(["market_uuid", "trading_day"])[
-    "wealth_day"
-].transform(gini)
+trader_day["gini"] = trader_day.groupby(
+    ["market_uuid", "trading_day"], observed=True, sort=False
+)["wealth_day"].transform(gini)
 
 
 # ============================================================
@@ -371,23 +642,32 @@ temp = trader_day[
     ]
 ].copy()
 
+
+def same_direction(position: pd.Series, move: pd.Series) -> np.ndarray:
+    """1 where a nonzero position and a price move share the same sign, else 0."""
+    side = np.sign(position.to_numpy(dtype=float))
+    return ((side != 0) & (side == np.sign(move.to_numpy(dtype=float)))).view(np.int8)
+
+
 # feedback trader: trades in direction of lagged price change
-temp["feedback_flag"] = (
-    (temp["net_position"] * (temp["price_L1"] - temp["price_L2"])) > 0
-).astype(int)
+temp["feedback_flag"] = same_direction(
+    temp["net_position"], temp["price_L1"] - temp["price_L2"]
+)
 
 # speculator: trades in direction of next-period price change
-temp["speculator_flag"] = (
-    (temp["net_position"] * (temp["price_next"] - temp["closing_price"])) > 0
-).astype(int)
+temp["speculator_flag"] = same_direction(
+    temp["net_position"], temp["price_next"] - temp["closing_price"]
+)
 
 # fundamentalist: trades against mispricing
-temp["fundamental_flag"] = (
-    (temp["net_position"] * (temp["closing_price"] - temp["fundamental_value"])) < 0
-).astype(int)
+temp["fundamental_flag"] = same_direction(
+    temp["net_position"], temp["fundamental_value"] - temp["closing_price"]
+)
 
 # aggregate flags per trader × market and classify
-type_counts = temp.groupby(["market_uuid", "participant_code"])[TYPE_FLAGS].sum()
+type_counts = temp.groupby(
+    ["market_uuid", "participant_code"], observed=True, sort=False
+)[TYPE_FLAGS].sum()
 
 
 def classify_trader(row: pd.Series) -> pd.Series:
@@ -413,11 +693,11 @@ trader_day = trader_day.merge(
 # columns constant within a market (treatment assignment)
 MARKET_LEVEL_COLS = ["market_uuid", "repetition", "gamified", "hybrid", "algo_present"]
 
-market_id = trader_day[MARKET_LEVEL_COLS].drop_duplicates()
+market_id = unique_rows(trader_day, MARKET_LEVEL_COLS)
 
 # aggregate trader-level variables to market-day
 market_day = (
-    trader_day.groupby(["market_uuid", "trading_day"])
+    trader_day.groupby(["market_uuid", "trading_day"], observed=True, sort=False)
     .agg(
         # market composition and demographics
         n_traders=("participant_code", "nunique"),
@@ -457,19 +737,28 @@ market_day = market_day.merge(
     mp, how="left", on=["market_uuid", "repetition", "trading_day"]
 )
 
-# cumulative surge / crash / bubble counts within each market
+# cumulative surge / crash / bubble counts within each market (in day order)
+market_day = market_day.sort_values(["market_uuid", "trading_day"], ignore_index=True)
 for col in ("surge", "crash", "bubble_period"):
-    market_day[f"cum_{col}"] = market_day.groupby("market_uuid")[col].cumsum()
+    market_day[f"cum_{col}"] = market_day.groupby(
+        "market_uuid", observed=True, sort=False
+    )[col].cumsum()
 market_day = market_day.sort_values(
-    by=["repetition", "trading_day"], ascending=True
+    by=["repetition", "trading_day", "market_uuid"], ascending=True
 ).reset_index(drop=True)
 
 # ============================================================
 # 8. Save panels
 # ============================================================
 
-trader_day.to_csv(f"{OUT_DIR}/trader_day_panel.csv", index=False)
-market_day.to_csv(f"{OUT_DIR}/market_day_panel.csv", index=False)
+
+def write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write ``df`` as CSV with Arrow's C++ writer instead of ``DataFrame.to_csv``."""
+    pv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+
+write_csv(trader_day, f"{OUT_DIR}/trader_day_panel.csv")
+write_csv(market_day, f"{OUT_DIR}/market_day_panel.csv")
 
 print(
     f"Saved trader_day ({trader_day.shape[0]:,} rows) "
@@ -486,4 +775,4 @@ exchange_rate = 1 / 500
 payoffs["payoff_cad"] = (payoffs["participant.payoff"] * exchange_rate).apply(
     lambda x: round(x, 2)
 )
-payoffs.to_csv(f"{OUT_DIR}/participant_payments.csv", index=False)
+write_csv(payoffs, f"{OUT_DIR}/participant_payments.csv")
@@ -0,0 +1,70 @@
+"""
+End-to-end checks for build_panels.py on corrupted copies of the raw exports.
+
+The script runs at import time with paths relative to its own directory, so
+each test lays out a scratch ``code/ raw_data/ processed_data/`` tree, links
+the real raw exports into it, and runs the script there.
+"""
+
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+ANALYSIS_DIR = Path(__file__).resolve().parents[1]
+SCRIPT = ANALYSIS_DIR / "code" / "build_panels.py"
+RAW_DIR = ANALYSIS_DIR / "raw_data"
+DATE = re.search(r'^DATE = "(.+)"', SCRIPT.read_text(), re.MULTILINE).group(1)
+MBO_NAME = f"trader_bridge_app_custom_export_mbo_{DATE}.csv"
+
+
+def build_panels(root: Path, mbo: pd.DataFrame | None = None) -> pd.DataFrame:
+    """Run the script in ``root``, optionally with a replacement MBO export."""
+    for sub in ("code", "raw_data", "processed_data"):
+        (root / sub).mkdir(parents=True)
+    shutil.copy(SCRIPT, root / "code")
+    for src in RAW_DIR.glob(f"*_{DATE}.csv"):
+        if mbo is None or src.name != MBO_NAME:
+            (root / "raw_data" / src.name).symlink_to(src)
+    if mbo is not None:
+        mbo.to_csv(root / "raw_data" / MBO_NAME, index=False)
+
+    subprocess.run([sys.executable, "build_panels.py"], cwd=root / "code", check=True)
+    return pd.read_csv(root / "processed_data" / "trader_day_panel.csv")
+
+
+def test_missing_buyer_is_not_counted_for_another_trader(tmp_path):
+    clean = build_panels(tmp_path / "clean")
+
+    mbo = pd.read_csv(
+        RAW_DIR / MBO_NAME, dtype=str, keep_default_na=False, encoding="utf-8-sig"
+    )
+    trades = mbo[mbo["record_kind"] == "trade"]
+
+    # a missing id that leaked in as code -1 would land on the previous day of
+    # the same market, under the lexically last trader id; blank a buy whose
+    # neighbouring key is a real row of the panel so a leak would show up
+    last_trader = max(set(trades["bid_trader_uuid"]) | set(trades["ask_trader_uuid"]))
+    last_markets = clean.loc[clean["trader_uuid"] == last_trader, "market_uuid"]
+    candidates = trades.index[
+        trades["trading_session_uuid"].isin(last_markets)
+        & (trades["trading_day"].astype(int) >= 2)
+        & trades["bid_trader_uuid"].isin(clean["trader_uuid"])
+        & (trades["bid_trader_uuid"] != last_trader)
+    ]
+    blanked = mbo.loc[candidates[0]]
+    mbo.loc[candidates[0], "bid_trader_uuid"] = ""
+    corrupted = build_panels(tmp_path / "corrupted", mbo)
+
+    lost = clean["n_buys"] - corrupted["n_buys"]
+    hit = (
+        (clean["market_uuid"] == blanked["trading_session_uuid"])
+        & (clean["trading_day"] == int(blanked["trading_day"]))
+        & (clean["trader_uuid"] == blanked["bid_trader_uuid"])
+    )
+    assert (lost[hit] == 1).all() and hit.sum() == 1
+    assert (lost[~hit] == 0).all()
+    assert (clean["n_sells"] == corrupted["n_sells"]).all()